@@ -1,9 +1,11 @@
-from django.utils.encoding import smart_str
 from django.utils.translation import gettext_lazy as _
+from rest_framework import HTTP_HEADER_ENCODING
 from rest_framework.authentication import get_authorization_header
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.request import Request
 
+_DEFAULT_BEARER = b"bearer"
+
 
 def get_authorization_token(request: Request, bearer: str = "Bearer"):
     """Parse a request for the JWT token.
@@ -13,7 +15,11 @@ def get_authorization_token(request: Request, bearer: str = "Bearer"):
     :return None|str: None if the request should pass through or the token str
     """
     auth = get_authorization_header(request).split()
-    if not auth or smart_str(auth[0].lower()) != bearer.lower():
+    if bearer == "Bearer":
+        scheme = _DEFAULT_BEARER
+    else:
+        scheme = bearer.lower().encode(HTTP_HEADER_ENCODING)
+    if not auth or auth[0].lower() != scheme:
         return None
 
     if len(auth) == 1:
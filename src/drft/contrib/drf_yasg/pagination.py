@@ -1,16 +1,43 @@
-from collections import OrderedDict
-from typing import Any, List, Optional
-
-try:
-    from drf_yasg import openapi
-except ImportError as exc:
-    raise ImportError(
-        "Missing drf-yasg package. Try pip install drft[yasg]."
-    ) from exc
+# pylint: disable=import-outside-toplevel
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 from rest_framework import pagination
 from rest_framework.response import Response
 
+if TYPE_CHECKING:  # pragma: no cover
+    from drf_yasg import openapi
+
+
+def _get_openapi():
+    """
+    Import drf_yasg.openapi on demand so that the paginator can be used at
+    runtime without loading drf-yasg.
+    :return: drf_yasg.openapi module
+    """
+    try:
+        from drf_yasg import openapi
+    except ImportError as exc:
+        raise ImportError(
+            "Missing drf-yasg package. Try pip install drft[yasg]."
+        ) from exc
+    return openapi
+
+
+@lru_cache(maxsize=None)
+def _get_static_props() -> Tuple["openapi.Schema", "openapi.Schema"]:
+    """
+    :return: The url and count schemas shared by all paginated schemas.
+    """
+    openapi = _get_openapi()
+    url_prop = openapi.Schema(
+        type=openapi.TYPE_STRING,
+        format=openapi.FORMAT_URI,
+        x_nullable=True,
+    )
+    count_prop = openapi.Schema(type=openapi.TYPE_INTEGER)
+    return url_prop, count_prop
+
 
 class LimitOffsetPagination(pagination.LimitOffsetPagination):
     """
@@ -25,37 +52,30 @@ class LimitOffsetPagination(pagination.LimitOffsetPagination):
         :return: rest_framework.response.Response
         """
         return Response(
-            OrderedDict(
-                [
-                    ("next", self.get_next_link()),
-                    ("previous", self.get_previous_link()),
-                    ("count", self.count),
-                    ("results", data),
-                ]
-            )
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "count": self.count,
+                "results": data,
+            }
         )
 
     @staticmethod
-    def get_swagger_paginated_schema(results_schema: openapi.Schema):
+    def get_swagger_paginated_schema(results_schema: "openapi.Schema"):
         """
         :param results_schema: openapi.Schema:
             Schema of the items within the paginated response
         :return: openapi.Schema
         """
-        url_prop = openapi.Schema(
-            type=openapi.TYPE_STRING,
-            format=openapi.FORMAT_URI,
-            x_nullable=True,
-        )
+        openapi = _get_openapi()
+        url_prop, count_prop = _get_static_props()
         return openapi.Schema(
             type=openapi.TYPE_OBJECT,
-            properties=OrderedDict(
-                (
-                    ("next", url_prop),
-                    ("previous", url_prop),
-                    ("count", openapi.Schema(type=openapi.TYPE_INTEGER)),
-                    ("results", results_schema),
-                )
-            ),
+            properties={
+                "next": url_prop,
+                "previous": url_prop,
+                "count": count_prop,
+                "results": results_schema,
+            },
             required=["results", "count"],
         )
@@ -1,6 +1,7 @@
 # pylint: disable=no-self-use,too-many-ancestors,no-member
 # pylint: disable=unused-argument,too-many-arguments
-from typing import Optional, Tuple
+from operator import attrgetter
+from typing import Any, Optional, Sequence, Tuple, Union
 
 from django.contrib.postgres.search import (
     SearchQuery,
@@ -8,14 +9,20 @@ from django.contrib.postgres.search import (
     SearchVector,
     TrigramSimilarity,
 )
-from django.db.models import Func, Q, QuerySet
+from django.db.models import F, Func, Q, QuerySet
+from django.db.models.constants import LOOKUP_SEP
 from django.utils.translation import gettext as _
 from rest_framework import exceptions, filters
 from rest_framework.request import Request
 from rest_framework.settings import api_settings
 
+from drft.contrib.postgres.lookups import register_lookups
+from drft.contrib.postgres.search import StrictWordSimilarity, WordSimilarity
 from drft.filters import OrderingFilterBackend
 
+# NOTE: typed as Any so that it can stand in for any memoized value
+_UNRESOLVED: Any = object()
+
 
 # NOTE: It may be important that the RelevanceSearchFilter is listed before
 # the RelevanceOrderingFilterBackend.
@@ -27,6 +34,8 @@ class RelevanceOrderingFilterBackend(OrderingFilterBackend):
 
     search_param = api_settings.SEARCH_PARAM
     default_relevance_field = "relevance"
+    # NOTE: like its base the backend holds no per-request state.
+    shareable = True
 
     def get_relevance_field(self, view) -> str:
         """
@@ -53,13 +62,12 @@ class RelevanceOrderingFilterBackend(OrderingFilterBackend):
             # the search param is provided when sorting by relevance. It may be
             # unnecessary in most cases.
             relevance_field = self.get_relevance_field(view)
-            relevance_included = False
-            for field in ordering:
-                relevance_included |= relevance_field in field.expression.name
-                if relevance_included:
-                    break
-            search_phrase = request.query_params.get(self.search_param, "")
-            if relevance_included and not search_phrase:
+            relevance_included = any(
+                field.expression.name == relevance_field for field in ordering
+            )
+            if relevance_included and not request.query_params.get(
+                self.search_param, ""
+            ):
                 raise exceptions.ValidationError(
                     {relevance_field: f"{self.search_param} is required"}
                 )
@@ -69,6 +77,24 @@ class RelevanceOrderingFilterBackend(OrderingFilterBackend):
 # NOTE: Requires the TrigramExtension
 # https://docs.djangoproject.com/en/3.1/ref/contrib/postgres/indexes/
 # https://docs.djangoproject.com/en/3.1/ref/contrib/postgres/operations/#django.contrib.postgres.operations.BtreeGistExtension
+# The candidate prefilter (`relevance_prefilter = True`) is only index backed
+# when the similarity field has a trigram index e.g.
+#   CREATE INDEX users_user_name_trgm ON users_user
+#   USING gin (name gin_trgm_ops);
+# or in the model Meta:
+#   indexes = [
+#       GinIndex(
+#           fields=["name"], name="users_user_name_trgm",
+#           opclasses=["gin_trgm_ops"],
+#       )
+#   ]
+# For the "word" and "strict_word" similarity kinds a GiST trigram index can
+# also serve the word similarity operators e.g.
+#   CREATE INDEX users_user_name_trgm ON users_user
+#   USING gist (name gist_trgm_ops);
+# The prefix condition of the prefilter is index backed with e.g.
+#   CREATE INDEX users_user_name_upper ON users_user
+#   (UPPER(name::text) varchar_pattern_ops);
 class RelevanceSearchFilter(filters.SearchFilter):
     """
     Provides an extensible search filter backend that exposes a relevance
@@ -91,18 +117,61 @@ class RelevanceSearchFilter(filters.SearchFilter):
 
             def get_queryset(self):
                 return User.objects.filter(...)
+
+    For large tables the search vector should be precomputed and stored on
+    the model (see drft.contrib.postgres.models.FullTextSearchModel) so that
+    the ranking reads the stored column rather than calling to_tsvector() on
+    every row. The filter does not match on the search vector (no @@
+    condition is emitted) so the column's GIN index is not used by it:
+
+        class UsersViewSet(ModelViewSet):
+            ...
+            relevance_search_vector_field = "search_vector"
+
+    Setting `similarity_kind` to "word" or "strict_word" on the view uses
+    pg_trgm's (strict) word similarity instead of the similarity of the whole
+    field value, which works better on long multi-word fields.
+
+    Setting `relevance_prefilter = True` on the view restricts the ranking to
+    the rows whose similarity field is word similar to, or starts with, the
+    search phrase so that the relevance is only computed for those candidates.
     """
 
     default_similarity_field = None
     default_search_vector = None
+    default_search_vector_field = None
+    default_relevance_prefilter = False
     default_search_type = "plain"
+    default_similarity_kind = "full"
+    similarity_functions = {
+        "full": TrigramSimilarity,
+        "word": WordSimilarity,
+        "strict_word": StrictWordSimilarity,
+    }
     default_min_relevance = 0.3
     default_max_relevance = None
     default_relevance_field = "relevance"
-    _similarity_field = None
-    _relevance_field = None
     search_description = _("A search phrase.")
 
+    __slots__ = (
+        "_similarity_field",
+        "_relevance_field",
+        "_min_relevance",
+        "_max_relevance",
+        "_search_type",
+        "_search_vector",
+        "_similarity_kind",
+    )
+
+    def __init__(self) -> None:
+        self._similarity_field: str = _UNRESOLVED
+        self._relevance_field: str = _UNRESOLVED
+        self._min_relevance: float = _UNRESOLVED
+        self._max_relevance: Optional[float] = _UNRESOLVED
+        self._search_type: str = _UNRESOLVED
+        self._search_vector: Optional[Union[SearchVector, F]] = _UNRESOLVED
+        self._similarity_kind: str = _UNRESOLVED
+
     def get_relevance_field(self, view):
         """
         Return the name to associate relevance to through the annotation.
@@ -110,7 +179,7 @@ class RelevanceSearchFilter(filters.SearchFilter):
         :return: str
         """
         # NOTE: Each backend is instantiated once per request
-        if self._relevance_field is None:
+        if self._relevance_field is _UNRESOLVED:
             self._relevance_field = getattr(
                 view, "relevance_field", self.default_relevance_field
             )
@@ -122,7 +191,7 @@ class RelevanceSearchFilter(filters.SearchFilter):
         :param view: Should have a `similarity_field` class attribute.
         :return: str
         """
-        if self._similarity_field is None:
+        if self._similarity_field is _UNRESOLVED:
             field_name = getattr(
                 view,
                 "relevance_similarity_field",
@@ -138,6 +207,8 @@ class RelevanceSearchFilter(filters.SearchFilter):
         :param view: Should have a `min_relevance` class attribute.
         :return: float
         """
+        if self._min_relevance is not _UNRESOLVED:
+            return self._min_relevance
         threshold = getattr(view, "min_relevance", self.default_min_relevance)
         if not isinstance(threshold, float):
             raise ValueError(
@@ -145,15 +216,17 @@ class RelevanceSearchFilter(filters.SearchFilter):
             )
         return threshold
 
-    def get_max_relevance(self, phrase: str, view) -> float:
+    def get_max_relevance(self, phrase: str, view) -> Optional[float]:
         """
-        Return the minimum relevance threshold for results to return.
+        Return the maximum relevance threshold for results to return.
         :param phrase: str The search term used.
-        :param view: Should have a `max_relevance` class attribute.
-        :return: float
+        :param view: Can have a `max_relevance` class attribute.
+        :return: float or None - Default None
         """
+        if self._max_relevance is not _UNRESOLVED:
+            return self._max_relevance
         limit = getattr(view, "max_relevance", self.default_max_relevance)
-        if not isinstance(limit, float):
+        if limit is not None and not isinstance(limit, float):
             raise ValueError(
                 f"{view.__class__.__name__}.max_relevance should be a float."
             )
@@ -166,6 +239,8 @@ class RelevanceSearchFilter(filters.SearchFilter):
         :return: str Default "plain"
         """
         # https://docs.djangoproject.com/en/3.1/ref/contrib/postgres/search/#searchquery
+        if self._search_type is not _UNRESOLVED:
+            return self._search_type
         search_type = getattr(view, "search_type", self.default_search_type)
         if search_type not in SearchQuery.SEARCH_TYPES:
             raise ValueError(
@@ -173,23 +248,52 @@ class RelevanceSearchFilter(filters.SearchFilter):
             )
         return search_type
 
-    def get_search_vector(self, queryset: QuerySet, view) -> SearchVector:
+    def get_similarity_kind(self, view) -> str:
+        """
+        Return the kind of trigram similarity to use.
+        :param view: Can have a `similarity_kind` class attribute.
+        :return: str "full", "word" or "strict_word" - Default "full"
+        """
+        if self._similarity_kind is not _UNRESOLVED:
+            return self._similarity_kind
+        similarity_kind = getattr(
+            view, "similarity_kind", self.default_similarity_kind
+        )
+        if similarity_kind not in self.similarity_functions:
+            raise ValueError(
+                f"{view.__class__.__name__}.similarity_kind is invalid."
+            )
+        return similarity_kind
+
+    def get_search_vector(
+        self, queryset: QuerySet, view
+    ) -> Optional[Union[SearchVector, F]]:
         """
-        Optionally return a SearchVector object.
+        Optionally return a SearchVector object. When the view declares a
+        `relevance_search_vector_field` an F object referencing the
+        precomputed SearchVectorField column is returned instead.
         :param queryset:
-        :param view: Should have a search_vector attribute.
-        :return: SearchVector or None - Default None
+        :param view: Should have a search_vector attribute or a
+            relevance_search_vector_field attribute.
+        :return: SearchVector, F or None - Default None
         """
+        if self._search_vector is not _UNRESOLVED:
+            return self._search_vector
+        search_vector_field = getattr(
+            view,
+            "relevance_search_vector_field",
+            self.default_search_vector_field,
+        )
+        if search_vector_field:
+            return F(search_vector_field)
         search_vector = getattr(
             view, "relevance_search_vector", self.default_search_vector
         )
         if search_vector:
             if isinstance(search_vector, (tuple, list)):
-                items = search_vector
-                name, weight = items[0]
-                search_vector = SearchVector(name, weight=weight)
-                for name, weight in items[1:]:
-                    search_vector += SearchVector(name, weight=weight)
+                search_vector = self._combine_search_vector(
+                    search_vector, view
+                )
             elif not isinstance(search_vector, SearchVector):
                 raise ValueError(
                     f"{view.__class__.__name__}.relevance_search_vector should"
@@ -197,6 +301,27 @@ class RelevanceSearchFilter(filters.SearchFilter):
                 )
         return search_vector
 
+    @staticmethod
+    def _combine_search_vector(items, view) -> SearchVector:
+        """
+        Return the sum of the SearchVector of each (name, weight) item. As it
+        only depends on the view's class configuration the result is cached on
+        the view class.
+        :param items: list or tuple of (name, weight) tuples
+        :param view:
+        :return: SearchVector
+        """
+        view_class = type(view)
+        cached = view_class.__dict__.get("_resolved_search_vector")
+        if cached is not None and cached[0] is items:
+            return cached[1]
+        name, weight = items[0]
+        search_vector = SearchVector(name, weight=weight)
+        for name, weight in items[1:]:
+            search_vector += SearchVector(name, weight=weight)
+        setattr(view_class, "_resolved_search_vector", (items, search_vector))
+        return search_vector
+
     def get_relevance(self, queryset: QuerySet, phrase: str, view) -> Func:
         """
         Return the Django Func to use for the relevance field annotation.
@@ -206,7 +331,10 @@ class RelevanceSearchFilter(filters.SearchFilter):
         :return: Func -> TrigramSimilarity + SearchRank
         """
         similarity_field = self.get_similarity_field(view)
-        relevance = TrigramSimilarity(similarity_field, phrase)
+        similarity = self.similarity_functions[self.get_similarity_kind(view)]
+        relevance = similarity(similarity_field, phrase)
+        # NOTE: search_vector may be an F object referencing a precomputed
+        # SearchVectorField, in which case the rank is read from the column.
         search_vector = self.get_search_vector(queryset, view)
         if search_vector:
             search_type = self.get_search_type(view)
@@ -225,7 +353,9 @@ class RelevanceSearchFilter(filters.SearchFilter):
         view,
     ) -> Tuple[Tuple, dict]:
         """
-        Return a tuple of the filter args and kwargs to use in the search.
+        Return a tuple of the filter args and kwargs that select the results
+        by relevance. Results whose similarity field starts with the phrase
+        are always included.
         :param phrase: str The search term used
         :param similarity_field: str The field to use in the search query
         :param relevance_field: str The field name to give to the annotation.
@@ -237,10 +367,40 @@ class RelevanceSearchFilter(filters.SearchFilter):
         relevance_filters = {f"{relevance_field}__gte": min_relevance}
         if max_relevance:
             relevance_filters[f"{relevance_field}__lte"] = max_relevance
-        return (
-            Q(**relevance_filters)
-            | Q(**{f"{similarity_field}__istartswith": phrase}),
-        ), {}
+        return (), relevance_filters
+
+    def get_relevance_prefilter(self, view) -> bool:
+        """
+        Return whether the ranking is restricted to the search candidates.
+        :param view: Can have a `relevance_prefilter` class attribute.
+        :return: bool
+        """
+        return getattr(
+            view, "relevance_prefilter", self.default_relevance_prefilter
+        )
+
+    def get_search_candidates(
+        self, queryset: QuerySet, phrase: str, view
+    ) -> QuerySet:
+        """
+        Return the queryset restricted to the rows that are worth ranking.
+        By default no restriction is applied unless the view sets
+        `relevance_prefilter = True`.
+        :param queryset:
+        :param phrase: str The search term used.
+        :param view: Can have a `relevance_prefilter` class attribute.
+        :return: QuerySet
+        """
+        if not self.get_relevance_prefilter(view):
+            return queryset
+        # NOTE: the trigram_word_similar lookup is only registered when used
+        register_lookups()
+        similarity_field = self.get_similarity_field(view)
+        candidates = queryset.filter(
+            Q(**{f"{similarity_field}__trigram_word_similar": phrase})
+            | Q(**{f"{similarity_field}__istartswith": phrase})
+        ).values("pk")
+        return queryset.filter(pk__in=candidates)
 
     def annotate_relevance(
         self, queryset: QuerySet, phrase: str, view
@@ -264,20 +424,62 @@ class RelevanceSearchFilter(filters.SearchFilter):
         :param view:
         :return: annotated and filtered queryset
         """
-        min_relevance = self.get_min_relevance(phrase, view)
-        max_relevance = self.get_max_relevance(phrase, view)
-        similarity_field = self.get_similarity_field(view)
-        relevance_field = self.get_relevance_field(view)
-        queryset = self.annotate_relevance(queryset, phrase, view)
+        if self._min_relevance is _UNRESOLVED:
+            self._resolve_view_config(queryset, phrase, view)
+        similarity_field = self._similarity_field
         args, kwargs = self.get_relevance_search_params(
             phrase=phrase,
             similarity_field=similarity_field,
-            relevance_field=relevance_field,
-            min_relevance=min_relevance,
-            max_relevance=max_relevance,
+            relevance_field=self._relevance_field,
+            min_relevance=self._min_relevance,
+            max_relevance=self._max_relevance,
             view=view,
         )
-        return queryset.filter(*args, **kwargs)
+        candidates = self.get_search_candidates(queryset, phrase, view)
+        return self.annotate_relevance(candidates, phrase, view).filter(
+            Q(*args, **kwargs)
+            | Q(**{f"{similarity_field}__istartswith": phrase})
+        )
+
+    def rerank(self, candidates: Sequence[Any], phrase: str, view) -> list:
+        """
+        Re-rank already fetched candidates in Python by the trigram similarity
+        of their similarity field to the search phrase, most similar first.
+        This is not applied by filter_queryset. It is intended for results
+        that were not ranked by the database e.g. vector search candidates.
+        Requires the rerank extra: pip install drft[rerank]
+        :param candidates: Sequence of model instances
+        :param phrase: str The search term used.
+        :param view:
+        :return: list
+        """
+        # pylint: disable=import-outside-toplevel
+        from drft.contrib.postgres.rerank import rerank
+
+        similarity_field = self.get_similarity_field(view)
+        key = attrgetter(similarity_field.replace(LOOKUP_SEP, "."))
+        return rerank(phrase, candidates, key=key)
+
+    def _resolve_view_config(
+        self, queryset: QuerySet, phrase: str, view
+    ) -> None:
+        """
+        Resolve and validate the relevance configuration of the view once so
+        that the search does not repeat the lookups for every get_* call.
+        :param queryset:
+        :param phrase: str The search term used.
+        :param view:
+        :return: None
+        """
+        # NOTE: Each backend is instantiated once per request
+        self._similarity_field = self.get_similarity_field(view)
+        self._relevance_field = self.get_relevance_field(view)
+        self._min_relevance = self.get_min_relevance(phrase, view)
+        self._max_relevance = self.get_max_relevance(phrase, view)
+        self._similarity_kind = self.get_similarity_kind(view)
+        self._search_vector = self.get_search_vector(queryset, view)
+        if self._search_vector:
+            self._search_type = self.get_search_type(view)
 
     def filter_queryset(
         self, request: Request, queryset: QuerySet, view
@@ -293,5 +495,6 @@ class RelevanceSearchFilter(filters.SearchFilter):
         phrase = request.query_params.get(self.search_param, "")
         similarity_field = self.get_similarity_field(view)
         if phrase and similarity_field:
+            self._resolve_view_config(queryset, phrase, view)
             return self.search(queryset, phrase, view)
         return super().filter_queryset(request, queryset, view)
@@ -0,0 +1,33 @@
+from django.db.models import CharField, Lookup, TextField
+
+
+class TrigramWordSimilar(Lookup):
+    """
+    Backport of the pg_trgm word similarity lookup, which is only provided by
+    newer versions of Django.
+
+    Usage:
+        register_lookups()
+        User.objects.filter(name__trigram_word_similar="alic")
+    """
+
+    lookup_name = "trigram_word_similar"
+
+    def as_postgresql(self, compiler, connection):
+        """
+        :return: sql, params
+        """
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} %%> {rhs}", tuple(lhs_params) + tuple(rhs_params)
+
+
+def register_lookups() -> None:
+    """
+    Register the lookups on CharField and TextField unless they are already
+    provided e.g. by newer versions of Django.
+    :return: None
+    """
+    for field_class in (CharField, TextField):
+        if TrigramWordSimilar.lookup_name not in field_class.get_lookups():
+            field_class.register_lookup(TrigramWordSimilar)
@@ -0,0 +1,62 @@
+# pylint: disable=too-few-public-methods
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+from django.utils.translation import gettext as _
+
+
+class FullTextSearchModel(models.Model):
+    """
+    Abstract base class with a GIN indexed, precomputed search vector column.
+    It is intended to be used alongside drft.models.TimestampedModel and the
+    RelevanceSearchFilter's `relevance_search_vector_field` view attribute,
+    which ranks by the stored column instead of calling to_tsvector() on
+    every row. The GIN index serves queries matching on the column, e.g.
+    `.filter(search_vector=SearchQuery(...))`, not the relevance ranking.
+
+    The column is not populated by Django. Keep it fresh with a database
+    trigger, e.g. in a RunSQL migration operation:
+
+        CREATE FUNCTION users_search_vector_trigger() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('english', coalesce(NEW.name, '')), 'A')
+                || setweight(
+                    to_tsvector('english', coalesce(NEW.username, '')), 'B'
+                );
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER users_search_vector_update
+        BEFORE INSERT OR UPDATE OF name, username ON users_user
+        FOR EACH ROW EXECUTE PROCEDURE users_search_vector_trigger();
+
+        UPDATE users_user SET search_vector =
+            setweight(to_tsvector('english', coalesce(name, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(username, '')), 'B');
+
+    Usage:
+
+        class User(TimestampedModel, FullTextSearchModel):
+            name = models.CharField(...)
+            username = models.CharField(...)
+
+            class Meta(FullTextSearchModel.Meta):
+                pass
+
+        class UsersViewSet(ModelViewSet):
+            filter_backends = [RelevanceSearchFilter]
+            relevance_similarity_field = "name"
+            relevance_search_vector_field = "search_vector"
+    """
+
+    search_vector = SearchVectorField(
+        _("Search vector"), null=True, editable=False
+    )
+
+    class Meta:
+        """Base Meta."""
+
+        abstract = True
+        indexes = [GinIndex(fields=["search_vector"])]
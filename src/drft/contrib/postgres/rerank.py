@@ -0,0 +1,121 @@
+"""
+drft.contrib.postgres.rerank
+
+Client side trigram re-ranking of candidates that have already been fetched
+from the database e.g. when combining vector search results with trigram
+similarity. Scores follow pg_trgm's similarity(): the number of shared
+trigrams over the number of distinct trigrams of both strings.
+
+Requires the rerank extra: pip install drft[rerank]
+"""
+import re
+from typing import Any, Callable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+    from numba import njit, prange
+except ImportError as exc:
+    raise ImportError(
+        "Missing numba package. Try pip install drft[rerank]."
+    ) from exc
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def encode_trigrams(text: str) -> np.ndarray:
+    """
+    Return the sorted, distinct trigrams of the text packed as uint64 values.
+    Like pg_trgm, words are lower cased and padded with two leading spaces and
+    one trailing space.
+    :param text: str
+    :return: np.ndarray
+    """
+    trigrams = set()
+    for word in _WORD_RE.findall(text.lower()):
+        padded = f"  {word} "
+        for first, second, third in zip(padded, padded[1:], padded[2:]):
+            # NOTE: code points fit in 21 bits
+            trigrams.add(ord(first) << 42 | ord(second) << 21 | ord(third))
+    return np.array(sorted(trigrams), dtype=np.uint64)
+
+
+def encode_candidates(texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode the trigrams of each text into a single flat array.
+    :param texts: Sequence of str
+    :return: trigrams, offsets - the trigrams of texts[i] are
+        trigrams[offsets[i]:offsets[i + 1]]
+    """
+    encoded = [encode_trigrams(text) for text in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(trigrams) for trigrams in encoded], out=offsets[1:])
+    if not encoded:
+        return np.empty(0, dtype=np.uint64), offsets
+    return np.concatenate(encoded), offsets
+
+
+@njit(cache=True, parallel=True)
+def score_trigrams(
+    query: np.ndarray, trigrams: np.ndarray, offsets: np.ndarray
+) -> np.ndarray:  # pragma: no cover
+    """
+    Return the trigram similarity of the query to each encoded candidate.
+    :param query: np.ndarray output of encode_trigrams
+    :param trigrams: np.ndarray output of encode_candidates
+    :param offsets: np.ndarray output of encode_candidates
+    :return: np.ndarray of float64 scores
+    """
+    count = offsets.shape[0] - 1
+    scores = np.zeros(count, dtype=np.float64)
+    for index in prange(count):  # pylint: disable=not-an-iterable
+        start = offsets[index]
+        end = offsets[index + 1]
+        position = start
+        cursor = 0
+        shared = 0
+        while cursor < query.shape[0] and position < end:
+            if query[cursor] == trigrams[position]:
+                shared += 1
+                cursor += 1
+                position += 1
+            elif query[cursor] < trigrams[position]:
+                cursor += 1
+            else:
+                position += 1
+        union = query.shape[0] + (end - start) - shared
+        if union:
+            scores[index] = shared / union
+    return scores
+
+
+def similarity_scores(phrase: str, texts: Sequence[str]) -> np.ndarray:
+    """
+    Return the trigram similarity of the phrase to each of the texts.
+    :param phrase: str
+    :param texts: Sequence of str
+    :return: np.ndarray of float64 scores
+    """
+    trigrams, offsets = encode_candidates(texts)
+    return score_trigrams(encode_trigrams(phrase), trigrams, offsets)
+
+
+def rerank(
+    phrase: str, candidates: Sequence[Any], key: Callable[[Any], str]
+) -> List[Any]:
+    """
+    Return the candidates sorted by their trigram similarity to the phrase,
+    most similar first. Ties keep their original order.
+
+    Usage:
+        users = rerank("alice", list(queryset), key=lambda user: user.name)
+
+    :param phrase: str
+    :param candidates: Sequence of objects
+    :param key: Callable returning the text of a candidate to compare
+    :return: list
+    """
+    scores = similarity_scores(
+        phrase, [key(item) or "" for item in candidates]
+    )
+    order = np.argsort(-scores, kind="stable")
+    return [candidates[index] for index in order]
@@ -0,0 +1,30 @@
+from django.db.models import FloatField, Func, Value
+
+
+class WordSimilarity(Func):
+    """
+    pg_trgm's word_similarity(), the greatest similarity between the string
+    and any continuous extent of words of the expression. Unlike
+    TrigramSimilarity, long values are not penalized for their length.
+
+    Usage:
+        User.objects.annotate(similarity=WordSimilarity("name", "alic"))
+    """
+
+    function = "WORD_SIMILARITY"
+    output_field = FloatField()
+
+    def __init__(self, expression, string, **extra):
+        if not hasattr(string, "resolve_expression"):
+            string = Value(string)
+        # NOTE: word_similarity takes the search string as its first argument
+        super().__init__(string, expression, **extra)
+
+
+class StrictWordSimilarity(WordSimilarity):
+    """
+    pg_trgm's strict_word_similarity(), which like WordSimilarity only
+    matches extents that are made of whole words.
+    """
+
+    function = "STRICT_WORD_SIMILARITY"
@@ -0,0 +1,74 @@
+"""
+drft.contrib.pydantic_core.renderers
+
+JSON rendering through pydantic-core's Rust encoder.
+
+Requires the json extra: pip install drft[json]
+"""
+from rest_framework import renderers
+
+try:
+    from pydantic_core import to_json
+except ImportError as exc:
+    raise ImportError(
+        "Missing pydantic-core package. Try pip install drft[json]."
+    ) from exc
+
+_LINE_SEPARATOR = "\u2028".encode()
+_PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+    """
+    Drop-in replacement of rest_framework.renderers.JSONRenderer that encodes
+    the data with pydantic_core.to_json. Values it does not support natively
+    e.g. lazy translations or querysets are encoded by the renderer's
+    encoder_class, and the data is rendered by JSONRenderer whenever the
+    encoding fails, when indentation is requested or when the settings ask
+    for ASCII or non-compact output.
+
+    NOTE: raw datetime, date, time, timedelta and Decimal values are encoded
+    by pydantic-core in their ISO 8601/str form, whereas serializer fields
+    already render those values as strings.
+
+    Usage:
+
+        # in settings.py
+        REST_FRAMEWORK = {
+            "DEFAULT_RENDERER_CLASSES": [
+                "drft.contrib.pydantic_core.renderers.FastJSONRenderer",
+                ...
+            ]
+        }
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON, returning a bytestring.
+        """
+        if data is None:
+            return b""
+
+        if (
+            self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {})
+            is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = to_json(data, fallback=self.encoder_class().default)
+        except (TypeError, ValueError):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # NOTE: strict JSON rejects NaN and Infinity, which JSONRenderer
+        # reports. Strings containing those words are rendered by it too.
+        if self.strict and (b"NaN" in ret or b"Infinity" in ret):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # We always fully escape \u2028 and \u2029 to ensure we output JSON
+        # that is a strict javascript subset, like JSONRenderer.
+        return ret.replace(_LINE_SEPARATOR, b"\\u2028").replace(
+            _PARAGRAPH_SEPARATOR, b"\\u2029"
+        )
@@ -5,7 +5,11 @@ drft.filters
 The `filters` module is designed to extend the functionality made available via
 both DRF filters and the `django-filter` projects.
 """
-from django.db.models import F, QuerySet
+from typing import Dict, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, OrderBy, Q, QuerySet
+from django.db.models.constants import LOOKUP_SEP
 from django_filters import filters as dj_filters
 from django_filters.constants import EMPTY_VALUES
 from django_filters.rest_framework import DjangoFilterBackend
@@ -24,20 +28,104 @@ class FilterBackend(DjangoFilterBackend):
             ]
     """
 
+    # NOTE: the backend holds no per-request state, so drft.views.APIView
+    # shares a single instance between requests. Subclasses are not shared
+    # unless they set shareable = True themselves.
+    shareable = True
+
+
+def _spans_multi_valued_relation(model, field_name: str) -> bool:
+    """
+    Return True if the field path follows a many-to-many or reverse foreign
+    key relation, where chained filter() calls differ from a single filter()
+    call with multiple conditions.
+    :param model:
+    :param field_name:
+    :return: bool
+    """
+    opts = model._meta
+    for part in field_name.split(LOOKUP_SEP):
+        try:
+            field = opts.get_field(part)
+        except FieldDoesNotExist:
+            return False
+        if not field.is_relation:
+            return False
+        if field.many_to_many or field.one_to_many or not field.related_model:
+            return True
+        opts = field.related_model._meta
+    return False
+
+
+def _is_batchable(filter_) -> bool:
+    """
+    Return True if the filter only applies a single lookup condition, so that
+    it can be combined with the other filters into a single filter() call.
+    :param filter_: django_filters.filters.Filter
+    :return: bool
+    """
+    filter_func = getattr(filter_.filter, "__func__", None)
+    return (
+        filter_func is dj_filters.Filter.filter
+        and not filter_.distinct
+        and filter_.model is not None
+        and not _spans_multi_valued_relation(filter_.model, filter_.field_name)
+    )
+
+
+class RequestAwareFilterMethod(dj_filters.FilterMethod):
+    """
+    Extends django_filters.filters.FilterMethod to provide access to the
+    request in the filter field method callable.
+    Signature for callable is now:
+        queryset: models.QuerySet
+        field_name: str
+        value: Any
+        request: rest_framework.request.Request
+    """
+
+    def __init__(self, filter_instance, request=None):
+        super().__init__(filter_instance)
+        self._request = request
+        # NOTE: the method property looks the callable up on every access
+        self._method = self.method
+
+    def __call__(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        return self._method(
+            qs, self.f.field_name, value, request=self._request
+        )
+
 
 class FilterSet(DjangoFilterSet):
     """
+    Filter field methods of a FilterSet are also passed the request.
+
     Usage:
         class UsersFilterSet(FilterSet):
+            username = CharFilter(method="filter_username")
+
             class Meta:
                 model = User
                 fields = ["created", "username"]
 
+            def filter_username(self, queryset, field_name, value, request):
+                ...
+
         class UsersViewSet(ModelViewSet):
             filterset_class = UserFilterSet
             ...
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for filter_ in self.filters.values():
+            if isinstance(filter_.filter, dj_filters.FilterMethod):
+                filter_.filter = RequestAwareFilterMethod(
+                    filter_, request=self.request
+                )
+
     def filter_queryset(self, queryset) -> QuerySet:
         """
         Filter the queryset with the underlying form's `cleaned_data`. You must
@@ -47,27 +135,38 @@ class FilterSet(DjangoFilterSet):
         applied to the queryset before it is cached.
         """
         # NOTE: We extend the class here from django_filter because the
-        # assert statement is unnecessary.
+        # assert statement is unnecessary. Adjacent plain lookup filters are
+        # collected and applied with a single filter() call to avoid cloning
+        # the queryset per filter, while the other filters are still applied
+        # in their declaration order e.g. method filters that slice.
+        conditions = []
         for name, value in self.form.cleaned_data.items():
-            queryset = self.filters[name].filter(queryset, value)
+            filter_ = self.filters[name]
+            if not _is_batchable(filter_):
+                if conditions:
+                    queryset = queryset.filter(*conditions)
+                    conditions = []
+                queryset = filter_.filter(queryset, value)
+            elif value not in EMPTY_VALUES:
+                lookup = f"{filter_.field_name}__{filter_.lookup_expr}"
+                condition = Q(**{lookup: value})
+                conditions.append(~condition if filter_.exclude else condition)
+        if conditions:
+            queryset = queryset.filter(*conditions)
         return queryset
 
 
-def _get_field_names(field: str, aliases: dict):
+def _get_field_names(trimmed_field: str, aliases: dict):
     """
     Override this method to customize how
-    :param field:
+    :param trimmed_field: The ordering field without its "-" prefix
     :param aliases:
     :return:
     """
-    trimmed = field.lstrip("-")
-    alias = aliases.get(trimmed, trimmed)
-    return alias.split(",")
+    return aliases.get(trimmed_field, trimmed_field).split(",")
 
 
-class OrderingFilterBackend(
-    filters.OrderingFilter
-):  # pylint: disable=function-redefined
+class OrderingFilterBackend(filters.OrderingFilter):
     """
     OrderingFilterBackend extends rest_framework.filters.OrderingFilter to
     provide a configurable `ordering_aliases` class attribute as well as by
@@ -92,6 +191,13 @@ class OrderingFilterBackend(
 
     ORDERING_ALIASES_KEY = "ordering_aliases"
     NULLS_LAST = True
+    # NOTE: the backend holds no per-request state, so drft.views.APIView
+    # shares a single instance between requests. Subclasses are not shared
+    # unless they set shareable = True themselves.
+    shareable = True
+    # NOTE: ordering expressions are immutable once built and the fields are
+    # limited to the configured ordering_fields, so they are shared.
+    _order_cache: Dict[Tuple[str, bool, bool], OrderBy] = {}
 
     def get_ordering(self, request, queryset, view):
         """
@@ -124,42 +230,27 @@ class OrderingFilterBackend(
         return [
             self.parse_ordering(field, field_name)
             for field in ordering
-            for field_name in get_field_names(field, aliases)
+            for field_name in get_field_names(field.lstrip("-"), aliases)
         ]
 
     def parse_ordering(self, field: str, field_name: str):
         """
         Return an F object given the field and the field name wherein the field
         is the user specified alias and the field name is the table column name
+        e.g. "-recent" and "-created" sort the created column ascending.
 
         :param field: str
         :param field_name: str
         :return: django.db.models.F
         """
-        trimmed = field_name.lstrip("-")
-        if field.startswith("-") and not field_name.startswith("-"):
-            return F(trimmed).desc(nulls_last=self.NULLS_LAST)
-        return F(trimmed).asc(nulls_last=self.NULLS_LAST)
-
-
-# pylint: disable=invalid-name
-def patched_filter_method_call(filter_method, qs, value):
-    """Patch the FilterMethod.__call__ method.
-
-    Provides access to the request in filter field method callable.
-    Signature for callable is now:
-        queryset: models.QuerySet
-        field_name: str
-        value: Any
-        request: rest_framework.request.Request
-    """
-    if value in EMPTY_VALUES:
-        return qs
-    filter_field = filter_method.f
-    filterset = filter_field.parent
-    return filter_method.method(
-        qs, filter_field.field_name, value, request=filterset.request
-    )
-
-
-dj_filters.FilterMethod.__call__ = patched_filter_method_call
+        descending = field.startswith("-") ^ field_name.startswith("-")
+        key = (field_name.lstrip("-"), descending, self.NULLS_LAST)
+        order_by = self._order_cache.get(key)
+        if order_by is None:
+            expression = F(key[0])
+            if descending:
+                order_by = expression.desc(nulls_last=self.NULLS_LAST)
+            else:
+                order_by = expression.asc(nulls_last=self.NULLS_LAST)
+            self._order_cache[key] = order_by
+        return order_by
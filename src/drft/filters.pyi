@@ -5,22 +5,29 @@ from django_filters.rest_framework import DjangoFilterBackend
 from django_filters.rest_framework import FilterSet as DjangoFilterSet
 from rest_framework import filters
 
-class FilterBackend(DjangoFilterBackend): ...
+class FilterBackend(DjangoFilterBackend):
+    shareable: bool = ...
+
+class RequestAwareFilterMethod(FilterMethod):
+    def __init__(
+        self, filter_instance: Any, request: Optional[Any] = ...
+    ) -> None: ...
+    def __call__(self, qs: Any, value: Any): ...
 
 class FilterSet(DjangoFilterSet):
+    def __init__(self, *args: Any, **kwargs: Any) -> None: ...
     def filter_queryset(self, queryset: QuerySet) -> QuerySet: ...
 
 class OrderingFilterBackend(filters.OrderingFilter):
     ORDERING_ALIASES_KEY: str = ...
     NULLS_LAST: bool = ...
+    shareable: bool = ...
     def get_ordering(self, request: Any, queryset: Any, view: Any): ...
     def parse_ordering_fields(
         self, ordering: Any, view: Any, get_field_names: Any = ...
     ): ...
     def parse_ordering(self, field: str, field_name: str) -> Any: ...
 
-def patched_filter_method_call(filter_method: Any, qs: Any, value: Any): ...
-
 class Filter:
     creation_counter: int = ...
     field_class: Any = ...
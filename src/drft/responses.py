@@ -0,0 +1,58 @@
+import json
+from typing import Any, Iterable, Iterator, Type
+
+from django.http import StreamingHttpResponse
+from rest_framework.settings import api_settings as drf_settings
+from rest_framework.utils import encoders
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    Streams an iterable of rows as a JSON array, encoding one row at a time so
+    that the serialized rows never exist in memory all at once.
+
+    NOTE: the response bypasses content negotiation and the renderers of the
+    view, the rows are encoded like rest_framework.renderers.JSONRenderer
+    encodes them.
+
+    Usage:
+
+        rows = (serializer.to_representation(obj) for obj in queryset)
+        return StreamingJSONResponse(rows)
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[Any],
+        *,
+        encoder_class: Type[json.JSONEncoder] = encoders.JSONEncoder,
+        **kwargs: Any,
+    ):
+        """
+        :param rows: iterable of JSON serializable rows
+        :param encoder_class: Optional json.JSONEncoder class.
+            Default: rest_framework.utils.encoders.JSONEncoder
+        :param kwargs: additional StreamingHttpResponse options
+        """
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(self._encode_rows(rows, encoder_class), **kwargs)
+
+    @staticmethod
+    def _encode_rows(
+        rows: Iterable[Any], encoder_class: Type[json.JSONEncoder]
+    ) -> Iterator[bytes]:
+        """
+        Yield the JSON array of the rows in chunks of one row.
+        """
+        encode = encoder_class(
+            ensure_ascii=not drf_settings.UNICODE_JSON,
+            allow_nan=not drf_settings.STRICT_JSON,
+            separators=(",", ":") if drf_settings.COMPACT_JSON else None,
+        ).encode
+        delimiter = b"["
+        for row in rows:
+            # NOTE: escaped like JSONRenderer to output a javascript subset
+            chunk = encode(row).replace("\u2028", "\\u2028")
+            yield delimiter + chunk.replace("\u2029", "\\u2029").encode()
+            delimiter = b","
+        yield b"[]" if delimiter == b"[" else b"]"
@@ -1,12 +1,45 @@
-from typing import Any, Optional
-
-from django.core.validators import RegexValidator
+import re
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Any, Callable, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Model
+from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
 from rest_framework import serializers
 
 ALIAS_MIN_LENGTH = 3
 ALIAS_MAX_LENGTH = 32
 ALIAS_REGEX = r"^[A-z0-9-_]*$"
+ALIAS_INVALID_MESSAGE = _("This value does not match the required pattern.")
+
+
+def _alias_validator(alias_regex: str, message: str) -> Callable[[str], None]:
+    """
+    Return a validator raising a ValidationError for values that do not match
+    the regex. Equivalent to a RegexValidator without its per call overhead.
+    :param alias_regex: regex string
+    :param message: error message
+    :return: Callable
+    """
+    search = re.compile(alias_regex).search
+
+    def validate_alias(value: str) -> None:
+        if not search(value):
+            raise ValidationError(message, code="invalid")
+
+    return validate_alias
+
+
+_DEFAULT_ALIAS_VALIDATOR = _alias_validator(ALIAS_REGEX, ALIAS_INVALID_MESSAGE)
+
+# NOTE: the builtins match the to_representation of these exact field types
+_PRIMITIVE_REPRESENTATIONS = {
+    serializers.IntegerField: int,
+    serializers.FloatField: float,
+    serializers.CharField: str,
+}
 
 
 class AliasField(serializers.CharField):
@@ -23,9 +56,7 @@ class AliasField(serializers.CharField):
                 model = settings.AUTH_USER_MODEL
     """
 
-    default_error_messages = {
-        "invalid": _("This value does not match the required pattern.")
-    }
+    default_error_messages = {"invalid": ALIAS_INVALID_MESSAGE}
 
     def __init__(
         self,
@@ -44,10 +75,12 @@ class AliasField(serializers.CharField):
         kwargs["min_length"] = min_length or ALIAS_MIN_LENGTH
         kwargs["max_length"] = max_length or ALIAS_MAX_LENGTH
         super().__init__(**kwargs)
-        alias_regex = alias_regex or ALIAS_REGEX
-        validator = RegexValidator(
-            alias_regex, message=self.error_messages["invalid"]
-        )
+        message = self.error_messages["invalid"]
+        # NOTE: share the module level validator unless it is customized
+        if alias_regex is None and message == ALIAS_INVALID_MESSAGE:
+            validator = _DEFAULT_ALIAS_VALIDATOR
+        else:
+            validator = _alias_validator(alias_regex or ALIAS_REGEX, message)
         self.validators.append(validator)
 
 
@@ -83,3 +116,127 @@ class ReadOnlyModelSerializer(ModelSerializer):
         PATCH/PUT are not allowed.
         """
         raise RuntimeError(f"{self.__class__.__name__} is read-only.")
+
+
+class FastSerializationMixin:
+    """
+    Serializes instances through a precomputed plan when every readable field
+    is an IntegerField, FloatField, CharField or BooleanField reading a
+    concrete model field, skipping the per field get_attribute/SkipField
+    machinery of rest_framework. Serializers with any other readable field
+    e.g. SerializerMethodField, nested or related fields, fall back to the
+    regular to_representation.
+
+    Usage:
+
+        class UserSerializer(FastSerializationMixin, ModelSerializer):
+            class Meta:
+                model = User
+                fields = ["id", "username", "is_active"]
+    """
+
+    @cached_property
+    def _fast_fields(
+        self,
+    ) -> Optional[Tuple[Tuple[str, Callable, Callable], ...]]:
+        """
+        Return the (field_name, getter, to_representation) plan of the
+        readable fields or None if any of them needs the regular path.
+        NOTE: the child of a ListSerializer computes this once for all rows.
+        """
+        model = getattr(getattr(self, "Meta", None), "model", None)
+        if model is None:
+            return None
+
+        fields = []
+        for field in self._readable_fields:  # type: ignore
+            field_type = type(field)
+            if field_type is serializers.BooleanField:
+                to_representation = field.to_representation
+            elif field_type in _PRIMITIVE_REPRESENTATIONS:
+                to_representation = _PRIMITIVE_REPRESENTATIONS[field_type]
+            else:
+                return None
+
+            try:
+                model_field = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                return None
+            if not model_field.concrete or model_field.is_relation:
+                return None
+
+            fields.append(
+                (
+                    field.field_name,
+                    attrgetter(model_field.attname),
+                    to_representation,
+                )
+            )
+        return tuple(fields)
+
+    def to_representation(self, instance):
+        """
+        Object instance -> Dict of primitive datatypes.
+        """
+        fields = self._fast_fields
+        # NOTE: mappings e.g. validated_data are read by the regular path
+        if fields is None or not isinstance(instance, Model):
+            return super().to_representation(instance)  # type: ignore
+
+        ret = OrderedDict()
+        for field_name, get_value, to_representation in fields:
+            value = get_value(instance)
+            ret[field_name] = (
+                None if value is None else to_representation(value)
+            )
+        return ret
+
+
+class SerializerCacheMixin:
+    """
+    Memoizes the representation of each instance while the root serializer
+    is serialized, so objects shared between several parents e.g. nested
+    relations are only serialized once per serializer class and fields. The
+    cache lives on the root serializer, so a new serializer e.g. after the
+    instance was saved computes the representation again.
+
+    NOTE: the cached representation is shared, so it must not be mutated.
+
+    Usage:
+
+        class AuthorSerializer(SerializerCacheMixin, ModelSerializer):
+            ...
+
+        class PostSerializer(ModelSerializer):
+            author = AuthorSerializer()
+    """
+
+    @cached_property
+    def _repr_cache_key(self) -> Tuple[type, Tuple[str, ...]]:
+        """
+        Return the part of the cache key that identifies the serializer.
+        NOTE: the field names tell apart serializers of the same class that
+        are configured with different fields.
+        """
+        return type(self), tuple(self.fields)  # type: ignore
+
+    def to_representation(self, instance):
+        """
+        Object instance -> Dict of primitive datatypes.
+        """
+        root = self.root  # type: ignore
+        try:
+            cache = root.__dict__["_repr_cache"]
+        except KeyError:
+            cache = root.__dict__["_repr_cache"] = {}
+
+        key = (*self._repr_cache_key, id(instance))
+        try:
+            return cache[key][1]
+        except KeyError:
+            pass
+
+        ret = super().to_representation(instance)  # type: ignore
+        # NOTE: keep a reference to the instance so that its id is not reused
+        cache[key] = (instance, ret)
+        return ret
@@ -1,6 +1,24 @@
-from typing import Any, List, Optional, Type
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
 
-from django.db.models import QuerySet
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import (
+    ForeignObjectRel,
+    Model,
+    QuerySet,
+    prefetch_related_objects,
+)
 from rest_framework import (
     decorators,
     mixins,
@@ -10,9 +28,12 @@ from rest_framework import (
     views,
     viewsets,
 )
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
 from rest_framework.settings import api_settings as drf_settings
 
 from drft.filters import FilterSet
+from drft.responses import StreamingJSONResponse
 
 
 def action(
@@ -58,14 +79,187 @@ def action(
         ) -> Response:
             ...
     """
-    defaults = dict(
+    return decorators.action(
+        methods,
         detail=detail,
         ordering=ordering,
         ordering_fields=ordering_fields,
         filterset_class=filterset_class,
+        **kwargs,
+    )
+
+
+def _get_relation(model: Type[Model], attr: str):
+    """
+    Return the relation of the model behind the attribute, if any.
+    :param model: django.db.models.Model class
+    :param attr: attribute name e.g. "author" or "post_set"
+    :return: tuple of the relation and whether it is a reverse relation
+    """
+    try:
+        field = model._meta.get_field(attr)
+    except FieldDoesNotExist:
+        field = None
+    if field is not None and not isinstance(field, ForeignObjectRel):
+        if field.is_relation and field.related_model is not None:
+            return field, False
+        return None, False
+
+    # NOTE: reverse relations are accessed through their accessor names
+    for relation in model._meta.related_objects:
+        if relation.get_accessor_name() == attr:
+            return relation, True
+    return None, False
+
+
+def _collect_prefetch_lookups(
+    serializer: serializers.BaseSerializer,
+    model: Type[Model],
+    prefix: str,
+    many: bool,
+    select: Set[str],
+    prefetch: Set[str],
+) -> None:
+    """
+    Collect the select_related and prefetch_related lookups needed by the
+    readable fields of the serializer, following nested serializers.
+    """
+    for field in serializer.fields.values():
+        if field.write_only or field.source == "*":
+            continue
+
+        related_model = model
+        lookup = prefix
+        many_lookup = many
+        resolved = True
+        for attr in field.source_attrs:
+            relation, reverse = _get_relation(related_model, attr)
+            if relation is None:
+                resolved = False
+                break
+            lookup = f"{lookup}__{attr}" if lookup else attr
+            # NOTE: select_related follows forward single valued relations
+            many_lookup = (
+                many_lookup
+                or reverse
+                or relation.one_to_many
+                or relation.many_to_many
+            )
+            related_model = relation.related_model
+        if lookup == prefix:
+            continue
+
+        if (
+            resolved
+            and isinstance(field, serializers.PrimaryKeyRelatedField)
+            and len(field.source_attrs) == 1
+            and not many_lookup
+        ):
+            # NOTE: the primary key is read from the foreign key column
+            continue
+
+        if many_lookup:
+            prefetch.add(lookup)
+        else:
+            select.add(lookup)
+
+        if resolved:
+            child = getattr(field, "child", field)
+            if isinstance(child, serializers.BaseSerializer):
+                _collect_prefetch_lookups(
+                    child, related_model, lookup, many_lookup, select, prefetch
+                )
+
+
+def _auto_prefetch(
+    queryset: QuerySet, serializer: serializers.BaseSerializer
+) -> QuerySet:
+    """
+    Apply the select_related and prefetch_related lookups derived from the
+    serializer fields to the queryset. The lookups are computed once per
+    serializer class, model and resolved fields.
+    :param queryset: django.db.models.QuerySet
+    :param serializer: the serializer of the view, built with its context
+    :return: django.db.models.QuerySet
+    """
+    model = queryset.model
+    serializer_class = type(serializer)
+    try:
+        lookups = serializer_class.__dict__["__drft_prefetch__"]
+    except KeyError:
+        lookups = {}
+        setattr(serializer_class, "__drft_prefetch__", lookups)
+
+    # NOTE: the fields can depend on the context e.g. the request
+    key = (
+        model,
+        tuple(
+            (name, field.source) for name, field in serializer.fields.items()
+        ),
     )
-    defaults.update(kwargs)
-    return decorators.action(methods, **defaults)
+    try:
+        select, prefetch = lookups[key]
+    except KeyError:
+        select_set: Set[str] = set()
+        prefetch_set: Set[str] = set()
+        _collect_prefetch_lookups(
+            serializer, model, "", False, select_set, prefetch_set
+        )
+        select, prefetch = lookups[key] = (
+            tuple(sorted(select_set)),
+            tuple(sorted(prefetch_set)),
+        )
+
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset
+
+
+QuerysetFilter = Callable[[Request, QuerySet, Any], QuerySet]
+
+
+def _per_request_filter(backend: type) -> QuerysetFilter:
+    """
+    Return a filter_queryset callable instantiating the backend per call.
+    """
+
+    def filter_queryset(request: Request, queryset: QuerySet, view: Any):
+        return backend().filter_queryset(request, queryset, view)
+
+    return filter_queryset
+
+
+STREAM_CHUNK_SIZE = 2000
+
+
+def _stream_rows(
+    serializer: serializers.BaseSerializer,
+    queryset: QuerySet,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Yield the representation of each object of the queryset, holding at most
+    one chunk of objects in memory.
+    """
+    # NOTE: iterator() skips the prefetch_related lookups, so they are
+    # applied to each chunk instead
+    # pylint: disable=protected-access
+    lookups = queryset._prefetch_related_lookups
+    if lookups:
+        queryset = queryset.prefetch_related(None)
+    objects = queryset.iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(objects, chunk_size))
+        if not chunk:
+            return
+        if lookups:
+            prefetch_related_objects(chunk, *lookups)
+        for obj in chunk:
+            yield serializer.to_representation(obj)
+        # NOTE: drop the representations cached by SerializerCacheMixin
+        serializer.__dict__.pop("_repr_cache", None)
 
 
 def paged_response(
@@ -73,7 +267,7 @@ def paged_response(
     view: viewsets.GenericViewSet,
     queryset: Optional[QuerySet] = None,
     status_code: Optional[int] = None,
-):
+) -> response.Response:
     """
     paged_response can be used when there is a need to paginate a custom
     API endpoint.
@@ -96,21 +290,46 @@ def paged_response(
     :param queryset: Optional django.db.models.QuerySet.
         Default: get_queryset output
     :param status_code: Optional int
-    :return: rest_framework.response.Response
+    :return: rest_framework.response.Response or
+        drft.responses.StreamingJSONResponse
+
+    Views that set `auto_prefetch = True` have the select_related and
+    prefetch_related lookups derived from their serializer applied to the
+    queryset.
+
+    Views that set `streaming_threshold` stream unpaginated querysets with
+    more rows than the threshold as a drft.responses.StreamingJSONResponse,
+    which bypasses the renderers of the view. The rows are fetched and
+    prefetched in chunks of STREAM_CHUNK_SIZE objects.
     """
-    status_code = status_code or status.HTTP_200_OK
-    queryset = queryset or view.get_queryset()
+    if queryset is None:
+        queryset = view.get_queryset()
+    if getattr(view, "auto_prefetch", False) and isinstance(
+        queryset, QuerySet
+    ):
+        queryset = _auto_prefetch(queryset, view.get_serializer())
     queryset = view.filter_queryset(queryset)
     page = view.paginate_queryset(queryset)
     if page is not None:
-        serializer = view.get_serializer(page, many=True)
-        return view.get_paginated_response(serializer.data)
-
-    serializer = view.get_serializer(queryset, many=True)
-    return response.Response(serializer.data, status=status_code)
+        return view.get_paginated_response(
+            view.get_serializer(page, many=True).data
+        )
 
+    threshold = getattr(view, "streaming_threshold", None)
+    if (
+        threshold is not None
+        and isinstance(queryset, QuerySet)
+        and queryset.count() > threshold
+    ):
+        return StreamingJSONResponse(
+            _stream_rows(view.get_serializer(), queryset),
+            status=status_code or status.HTTP_200_OK,
+        )
 
-_SENTINAL = object()
+    return response.Response(
+        view.get_serializer(queryset, many=True).data,
+        status=status_code or status.HTTP_200_OK,
+    )
 
 
 class APIView(
@@ -132,19 +351,46 @@ class APIView(
     serializer_class: Type[serializers.Serializer]
     queryset: Optional[QuerySet] = None
     pagination_class = drf_settings.DEFAULT_PAGINATION_CLASS
-    filter_backends = drf_settings.DEFAULT_FILTER_BACKENDS
-    _paginator = _SENTINAL
-
-    def get_serializer(self, *args, **kwargs):
+    filter_backends: Sequence[type] = tuple(
+        drf_settings.DEFAULT_FILTER_BACKENDS
+    )
+    auto_prefetch = False
+    streaming_threshold: Optional[int] = None
+    _serializer_context: Optional[Dict[str, Any]] = None
+    _paginator: Optional[BasePagination] = None
+    _paginator_computed = False
+    _overrides_get_serializer_class = False
+    _queryset_filters: Dict[Tuple[type, ...], Tuple[QuerysetFilter, ...]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # NOTE: serializer_class itself is read per call, since the action
+        # decorator sets it on the view instance.
+        cls._overrides_get_serializer_class = (
+            cls.get_serializer_class is not APIView.get_serializer_class
+        )
+        filter_backends = cls.__dict__.get("filter_backends")
+        if filter_backends is not None and not isinstance(
+            filter_backends, tuple
+        ):
+            cls.filter_backends = tuple(filter_backends)
+
+    def get_serializer(
+        self, *args: Any, **kwargs: Any
+    ) -> serializers.BaseSerializer:
         """
         Return the serializer instance that should be used for validating and
         deserializing input, and for serializing output.
         """
-        serializer_class = self.get_serializer_class()
+        serializer_class = None
+        if not self._overrides_get_serializer_class:
+            serializer_class = getattr(self, "serializer_class", None)
+        if serializer_class is None:
+            serializer_class = self.get_serializer_class()
         kwargs["context"] = self.get_serializer_context()
         return serializer_class(*args, **kwargs)
 
-    def get_serializer_class(self):
+    def get_serializer_class(self) -> Type[serializers.BaseSerializer]:
         """
         Return the class to use for the serializer.
         Defaults to using `self.serializer_class`.
@@ -162,15 +408,27 @@ class APIView(
 
         return self.serializer_class
 
-    def get_serializer_context(self):
+    def get_serializer_context(self) -> Dict[str, Any]:
         """
         Extra context provided to the serializer class.
+
+        NOTE: the context is built once per request and shared by all of the
+        serializers of the request. It stays a mutable dict so overrides can
+        keep updating the context returned by super().
         """
-        return {
-            "request": self.request,
-            "format": self.format_kwarg,
-            "view": self,
-        }
+        context = self._serializer_context
+        if context is None:
+            context = self._serializer_context = {
+                "request": self.request,
+                "format": self.format_kwarg,
+                "view": self,
+            }
+        return context
+
+    def initial(self, request: Request, *args: Any, **kwargs: Any) -> None:
+        super().initial(request, *args, **kwargs)
+        # NOTE: the format_kwarg of the context is only known at this point
+        self._serializer_context = None
 
     def get_queryset(self) -> QuerySet:
         """
@@ -191,50 +449,92 @@ class APIView(
             queryset = queryset.all()
         return queryset
 
-    def filter_queryset(self, queryset):
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
         """
         Filter the queryset using the each of the classes listed in
         filter_backends.
         :param queryset: django.db.models.QuerySet
         :return: django.db.models.QuerySet
         """
-        for backend in list(self.filter_backends):
-            queryset = backend().filter_queryset(self.request, queryset, self)
+        request = self.request
+        for filter_ in self._get_queryset_filters(self.filter_backends):
+            queryset = filter_(request, queryset, self)
         return queryset
 
+    @classmethod
+    def _get_queryset_filters(
+        cls, filter_backends: Sequence[type]
+    ) -> Tuple[QuerysetFilter, ...]:
+        """
+        Return the filter_queryset callables of the filter backends, which are
+        resolved once per view class. Backends that set `shareable = True`
+        in their own class body hold no request state and a single instance
+        is shared between requests. The flag is not inherited since a
+        subclass may add request state. Any other backend is instantiated
+        for every call.
+
+        NOTE: the callables are keyed on the backend classes as well, since
+        the action decorator sets filter_backends on the view instance.
+        :param filter_backends: the filter backend classes of the view
+        :return: tuple of callables(request, queryset, view) -> QuerySet
+        """
+        try:
+            cache = cls.__dict__["_queryset_filters"]
+        except KeyError:
+            cache = {}
+            setattr(cls, "_queryset_filters", cache)
+
+        key = tuple(filter_backends)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        filters = tuple(
+            backend().filter_queryset
+            if backend.__dict__.get("shareable", False)
+            else _per_request_filter(backend)
+            for backend in key
+        )
+        cache[key] = filters
+        return filters
+
     @property
-    def paginator(self):
+    def paginator(self) -> Optional[BasePagination]:
         """
         :return: instance of the view pagination class
         """
-        if self._paginator is _SENTINAL:
-            if self.pagination_class is None:
-                self._paginator = None
-            else:
-                self._paginator = self.pagination_class()
-        return self._paginator
+        if self._paginator_computed:
+            return self._paginator
 
-    def paginate_queryset(self, queryset):
+        paginator = self.pagination_class
+        if paginator is not None:
+            paginator = paginator()
+        self._paginator = paginator
+        self._paginator_computed = True
+        return paginator
+
+    def paginate_queryset(self, queryset: QuerySet) -> Optional[List[Any]]:
         """
 
         :param queryset:
         :return:
         """
-        if self.paginator is None:
+        paginator = self.paginator
+        if paginator is None:
             return None
-        return self.paginator.paginate_queryset(
-            queryset, self.request, view=self
-        )
+        return paginator.paginate_queryset(queryset, self.request, view=self)
 
-    def get_paginated_response(self, data):
+    def get_paginated_response(self, data: Any) -> response.Response:
         """
 
         :param data:
         :return:
         """
-        if self.paginator is None:
+        paginator = self.paginator
+        if paginator is None:
             raise ValueError(
                 f"{self.__class__.__name__}.pagination_class is None or not "
                 "defined."
             )
-        return self.paginator.get_paginated_response(data)
+        return paginator.get_paginated_response(data)
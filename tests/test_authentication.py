@@ -34,3 +34,12 @@ class TestGetAuthorizationToken:
         )
         gotten = get_authorization_token(request=req)
         assert gotten.decode() == token
+
+    def test_get_authorization_token_with_custom_bearer(self):
+        token = "test"
+        req = APIRequestFactory().get(
+            "/foo/", HTTP_AUTHORIZATION=f"Token {token}"
+        )
+        assert get_authorization_token(request=req) is None
+        gotten = get_authorization_token(request=req, bearer="Token")
+        assert gotten.decode() == token
@@ -1,5 +1,6 @@
 import pytest
-from django.db.models import F, QuerySet
+from django.contrib.auth.models import User
+from django.db.models import F, Q, QuerySet
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 
@@ -8,6 +9,7 @@ from drft.filters import (
     FilterSet,
     NumberFilter,
     OrderingFilterBackend,
+    RequestAwareFilterMethod,
 )
 
 
@@ -21,6 +23,12 @@ class DummyFilterSet(FilterSet):
         return queryset.filter(**{field_name: value})
 
 
+class UsersFilterSet(FilterSet):
+    class Meta:
+        model = User
+        fields = ["username", "is_active", "groups__name", "email"]
+
+
 @pytest.fixture()
 def view(mocker):
     """
@@ -59,6 +67,55 @@ class TestFilterBackend:
         )
         assert queryset == trace.all()
 
+    def test_filter_methods_are_bound_to_the_request(self, mocker):
+        req = Request(APIRequestFactory().get("/test/?cost=1"))
+        filterset = DummyFilterSet(
+            req.query_params, queryset=mocker.Mock(), request=req
+        )
+        filter_method = filterset.filters["cost"].filter
+        assert isinstance(filter_method, RequestAwareFilterMethod)
+        assert filter_method._request is req
+        assert filter_method._method == filterset.filter_cost
+
+
+@pytest.mark.unit
+class TestFilterSet:
+    def test_lookup_filters_are_applied_together(self, mocker):
+        trace = mocker.Mock()
+        filterset = UsersFilterSet({"username": "foo", "is_active": "true"})
+        assert filterset.is_valid()
+        queryset = filterset.filter_queryset(trace)
+        trace.filter.assert_called_once_with(
+            Q(username__exact="foo"), Q(is_active__exact=True)
+        )
+        assert queryset == trace.filter.return_value
+
+    def test_multi_valued_relation_filters_are_chained(self, mocker):
+        trace = mocker.Mock()
+        filterset = UsersFilterSet({"username": "foo", "groups__name": "bar"})
+        assert filterset.is_valid()
+        queryset = filterset.filter_queryset(trace)
+        trace.filter.assert_called_once_with(Q(username__exact="foo"))
+        trace.filter.return_value.filter.assert_called_once_with(
+            groups__name__exact="bar"
+        )
+        assert queryset == trace.filter.return_value.filter.return_value
+
+    def test_filters_are_applied_in_declaration_order(self, mocker):
+        trace = mocker.Mock()
+        filterset = UsersFilterSet(
+            {"username": "foo", "groups__name": "bar", "email": "baz"}
+        )
+        assert filterset.is_valid()
+        queryset = filterset.filter_queryset(trace)
+        trace.filter.assert_called_once_with(Q(username__exact="foo"))
+        grouped = trace.filter.return_value.filter
+        grouped.assert_called_once_with(groups__name__exact="bar")
+        grouped.return_value.filter.assert_called_once_with(
+            Q(email__exact="baz")
+        )
+        assert queryset == grouped.return_value.filter.return_value
+
 
 @pytest.mark.unit
 class TestOrderingFilterBackend:
@@ -91,6 +148,23 @@ class TestOrderingFilterBackend:
             F("created").asc(nulls_last=True),
         ]
 
+    def test_ordering_aliases_with_descending_alias(self, mocker, view):
+        queryset = mocker.Mock()
+        backend = OrderingFilterBackend()
+        req = Request(APIRequestFactory().get("/test/?sort=recent"))
+        ordering = backend.get_ordering(req, queryset, view)
+        assert ordering == [
+            F("published").asc(nulls_last=True),
+            F("created").desc(nulls_last=True),
+        ]
+
+    def test_parse_ordering_reuses_expressions(self):
+        ordering = OrderingFilterBackend().parse_ordering("-recent", "created")
+        assert ordering == F("created").desc(nulls_last=True)
+        assert ordering is OrderingFilterBackend().parse_ordering(
+            "recent", "-created"
+        )
+
     def test_ordering_aliases_with_no_ordering_parameter(self, mocker, view):
         queryset = mocker.Mock()
         backend = OrderingFilterBackend()
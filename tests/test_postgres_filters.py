@@ -0,0 +1,170 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import models
+from django.db.models import CharField, TextField
+from django.db.utils import ConnectionHandler
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from drft.contrib.postgres.filters import RelevanceSearchFilter
+from drft.contrib.postgres.lookups import TrigramWordSimilar, register_lookups
+from drft.contrib.postgres.models import FullTextSearchModel
+
+
+class Document(FullTextSearchModel):
+    title = models.CharField(max_length=100)
+
+    class Meta(FullTextSearchModel.Meta):
+        app_label = "tests"
+        managed = False
+
+
+@pytest.fixture(scope="module")
+def postgres():
+    """
+    A postgresql connection used to compile the queries, no database needed.
+    """
+    connections = ConnectionHandler(
+        {
+            "default": {
+                "ENGINE": "django.db.backends.postgresql",
+                "NAME": "drft",
+            }
+        }
+    )
+    return connections["default"]
+
+
+def compile_sql(queryset, connection):
+    return queryset.query.get_compiler(connection=connection).as_sql()
+
+
+@pytest.fixture()
+def view(mocker):
+    view = mocker.Mock(spec=[])
+    view.relevance_similarity_field = "username"
+    view.min_relevance = 0.3
+    return view
+
+
+def search(view, phrase="alic", queryset=None):
+    backend = RelevanceSearchFilter()
+    request = Request(
+        APIRequestFactory().get("/", {backend.search_param: phrase})
+    )
+    if queryset is None:
+        queryset = User.objects.all()
+    return backend.filter_queryset(request, queryset, view)
+
+
+class TestTrigramWordSimilar:
+    def test_compiles_to_the_word_similarity_operator(self, postgres):
+        register_lookups()
+        queryset = User.objects.filter(username__trigram_word_similar="alic")
+        sql, params = compile_sql(queryset, postgres)
+        assert sql.endswith('WHERE "auth_user"."username" %%> %s')
+        assert params == ("alic",)
+
+    def test_is_registered_by_the_prefilter_only(self, view, postgres):
+        for field_class in (CharField, TextField):
+            if "trigram_word_similar" in field_class.get_lookups():
+                field_class._unregister_lookup(TrigramWordSimilar)
+                field_class._clear_cached_lookups()
+        search(view)
+        assert "trigram_word_similar" not in CharField.get_lookups()
+
+        view.relevance_prefilter = True
+        sql, params = compile_sql(search(view), postgres)
+        assert "trigram_word_similar" in CharField.get_lookups()
+        assert "trigram_word_similar" in TextField.get_lookups()
+        assert '."username" %%> %s' in sql
+        assert "alic" in params
+
+
+class TestRelevanceSearch:
+    def test_relevance_or_prefix_without_the_prefilter(self, view, postgres):
+        sql, params = compile_sql(search(view), postgres)
+        assert "UNION" not in sql
+        assert sql.count("SIMILARITY(") == 2
+        assert ">= %s OR UPPER(" in sql
+        assert params[-2:] == (0.3, "alic%")
+
+    def test_candidates_are_selected_once_with_the_prefilter(
+        self, view, postgres
+    ):
+        view.relevance_prefilter = True
+        sql, params = compile_sql(search(view), postgres)
+        assert "UNION" not in sql
+        assert sql.count("SIMILARITY(") == 2
+        assert sql.count("%%> %s OR UPPER(") == 1
+        assert ">= %s OR UPPER(" in sql
+        assert params.count("alic%") == 2
+
+    def test_rank_reads_the_stored_search_vector(self, view, postgres):
+        view.relevance_similarity_field = "title"
+        view.relevance_search_vector_field = "search_vector"
+        sql, params = compile_sql(
+            search(view, queryset=Document.objects.all()), postgres
+        )
+        assert (
+            'ts_rank("tests_document"."search_vector", plainto_tsquery(%s))'
+            in sql
+        )
+        assert "to_tsvector" not in sql
+        assert "@@" not in sql
+
+    @pytest.mark.parametrize(
+        "similarity_kind,function",
+        [
+            ("word", "WORD_SIMILARITY"),
+            ("strict_word", "STRICT_WORD_SIMILARITY"),
+        ],
+    )
+    def test_word_similarity_kinds(
+        self, view, postgres, similarity_kind, function
+    ):
+        view.similarity_kind = similarity_kind
+        sql, params = compile_sql(search(view), postgres)
+        # NOTE: the phrase comes first, word_similarity is not symmetric
+        assert sql.count(f'{function}(%s, "auth_user"."username")') == 2
+        assert sql.count("SIMILARITY(") == 2
+        assert params[0] == "alic"
+
+    def test_invalid_similarity_kind(self, view):
+        view.similarity_kind = "fuzzy"
+        with pytest.raises(ValueError, match="similarity_kind is invalid"):
+            search(view)
+
+    def test_max_relevance_is_optional(self, view, postgres):
+        view.max_relevance = None
+        sql, params = compile_sql(search(view), postgres)
+        assert ") <= %s" not in sql
+
+        view.max_relevance = 0.9
+        sql, params = compile_sql(search(view), postgres)
+        assert ") <= %s" in sql
+        assert 0.9 in params
+
+    def test_search_vector_items_are_combined_per_view_class(self, postgres):
+        class ParentView:
+            relevance_similarity_field = "username"
+            relevance_search_vector = (("username", "A"),)
+            min_relevance = 0.3
+
+        class ChildView(ParentView):
+            relevance_search_vector = (("username", "A"), ("email", "B"))
+
+        sql, _ = compile_sql(search(ParentView()), postgres)
+        assert 'COALESCE("auth_user"."email"' not in sql
+        sql, _ = compile_sql(search(ChildView()), postgres)
+        assert 'to_tsvector(COALESCE("auth_user"."email", %s))' in sql
+        for view_class in (ParentView, ChildView):
+            items, _ = view_class.__dict__["_resolved_search_vector"]
+            assert items is view_class.relevance_search_vector
+
+    def test_search_resolves_the_view_config(self, view, postgres):
+        backend = RelevanceSearchFilter()
+        queryset = backend.search(User.objects.all(), "alic", view)
+        assert compile_sql(queryset, postgres) == compile_sql(
+            search(view), postgres
+        )
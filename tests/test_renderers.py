@@ -0,0 +1,127 @@
+import pytest
+
+pytest.importorskip("pydantic_core")
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.utils.translation import gettext_lazy  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from drft.contrib.pydantic_core import renderers  # noqa: E402
+from drft.contrib.pydantic_core.renderers import FastJSONRenderer  # noqa: E402
+
+DATA = {
+    "id": 1,
+    "name": "Zoë",
+    "score": 0.5,
+    "active": True,
+    "parent": None,
+    "tags": ["a", "b"],
+    "nested": {"count": 2},
+}
+
+
+def render(renderer_class, data, accepted_media_type=None):
+    return renderer_class().render(data, accepted_media_type, {})
+
+
+def assert_renders_like_json_renderer(
+    data, accepted_media_type=None, fast=FastJSONRenderer, base=JSONRenderer
+):
+    expected = render(base, data, accepted_media_type)
+    assert render(fast, data, accepted_media_type) == expected
+    return expected
+
+
+class TestFastJSONRenderer:
+    def test_compact_output(self, mocker):
+        to_json = mocker.spy(renderers, "to_json")
+        assert_renders_like_json_renderer(DATA)
+        assert to_json.call_count == 1
+        assert render(FastJSONRenderer, None) == b""
+
+    def test_ascii_output(self):
+        class ASCIIRenderer(FastJSONRenderer):
+            ensure_ascii = True
+
+        class ASCIIJSONRenderer(JSONRenderer):
+            ensure_ascii = True
+
+        rendered = assert_renders_like_json_renderer(
+            DATA, fast=ASCIIRenderer, base=ASCIIJSONRenderer
+        )
+        assert b"\\u00eb" in rendered
+
+    def test_non_compact_output(self):
+        class SpacedRenderer(FastJSONRenderer):
+            compact = False
+
+        class SpacedJSONRenderer(JSONRenderer):
+            compact = False
+
+        rendered = assert_renders_like_json_renderer(
+            DATA, fast=SpacedRenderer, base=SpacedJSONRenderer
+        )
+        assert b'"id": 1, ' in rendered
+
+    def test_indented_output(self):
+        rendered = assert_renders_like_json_renderer(
+            DATA, "application/json; indent=2"
+        )
+        assert b'\n  "id": 1,' in rendered
+
+    def test_encoding_errors_fall_back(self, mocker):
+        mocker.patch(
+            "drft.contrib.pydantic_core.renderers.to_json",
+            side_effect=ValueError,
+        )
+        assert_renders_like_json_renderer(DATA)
+
+    def test_unsupported_values_raise_like_json_renderer(self):
+        data = {"value": object()}
+        with pytest.raises(TypeError):
+            render(JSONRenderer, data)
+        with pytest.raises(TypeError):
+            render(FastJSONRenderer, data)
+
+    def test_strict_nan_and_infinity_fall_back(self):
+        for value in (float("nan"), float("inf"), float("-inf")):
+            with pytest.raises(ValueError):
+                render(JSONRenderer, {"value": value})
+            with pytest.raises(ValueError):
+                render(FastJSONRenderer, {"value": value})
+
+        assert_renders_like_json_renderer({"value": "NaN or Infinity"})
+
+        class LaxRenderer(FastJSONRenderer):
+            strict = False
+
+        class LaxJSONRenderer(JSONRenderer):
+            strict = False
+
+        rendered = assert_renders_like_json_renderer(
+            [float("nan"), float("inf")],
+            fast=LaxRenderer,
+            base=LaxJSONRenderer,
+        )
+        assert rendered == b"[NaN,Infinity]"
+
+    @pytest.mark.django_db
+    def test_unsupported_values_use_the_encoder_class(self):
+        User.objects.create(username="one")
+        User.objects.create(username="two")
+        data = {
+            "label": gettext_lazy("A search phrase."),
+            "usernames": User.objects.order_by("id").values_list(
+                "username", flat=True
+            ),
+        }
+        rendered = assert_renders_like_json_renderer(data)
+        assert rendered == (
+            b'{"label":"A search phrase.","usernames":["one","two"]}'
+        )
+
+    def test_line_and_paragraph_separators_are_escaped(self):
+        rendered = assert_renders_like_json_renderer(
+            {"text": "one\u2028two\u2029three"}
+        )
+        assert rendered == b'{"text":"one\\u2028two\\u2029three"}'
@@ -0,0 +1,61 @@
+import pytest
+
+pytest.importorskip("numba")
+
+from drft.contrib.postgres.rerank import (  # noqa: E402
+    encode_candidates,
+    encode_trigrams,
+    rerank,
+    similarity_scores,
+)
+
+
+def trigram(text):
+    first, second, third = text
+    return ord(first) << 42 | ord(second) << 21 | ord(third)
+
+
+class TestEncodeTrigrams:
+    def test_words_are_padded_and_lower_cased(self):
+        assert encode_trigrams("Cat").tolist() == sorted(
+            map(trigram, ["  c", " ca", "cat", "at "])
+        )
+
+    def test_trigrams_are_distinct(self):
+        assert (
+            encode_trigrams("cat, cat").tolist()
+            == encode_trigrams("cat").tolist()
+        )
+        assert encode_trigrams("").tolist() == []
+
+    def test_candidates_are_flattened(self):
+        trigrams, offsets = encode_candidates(["cat", "", "dog"])
+        assert offsets.tolist() == [0, 4, 4, 8]
+        assert trigrams[4:8].tolist() == encode_trigrams("dog").tolist()
+
+        trigrams, offsets = encode_candidates([])
+        assert trigrams.tolist() == []
+        assert offsets.tolist() == [0]
+
+
+class TestSimilarityScores:
+    def test_scores_match_pg_trgm_similarity(self):
+        scores = similarity_scores("word", ["word", "words", "", "xyz"])
+        assert scores.tolist() == pytest.approx([1.0, 4 / 7, 0.0, 0.0])
+
+
+class TestRerank:
+    def test_most_similar_first(self):
+        assert rerank("alice", ["bob", "alicia", "alice"], key=str) == [
+            "alice",
+            "alicia",
+            "bob",
+        ]
+
+    def test_ties_keep_their_order(self):
+        candidates = [{"name": None}, {"name": "x"}, {"name": "alice"}]
+        assert rerank("alice", candidates, key=lambda item: item["name"]) == [
+            {"name": "alice"},
+            {"name": None},
+            {"name": "x"},
+        ]
@@ -0,0 +1,192 @@
+import pytest
+from django.db import models
+from rest_framework import serializers
+
+from drft.serializers import (
+    _DEFAULT_ALIAS_VALIDATOR,
+    AliasField,
+    FastSerializationMixin,
+    SerializerCacheMixin,
+)
+
+
+class Measurement(models.Model):
+    count = models.IntegerField(null=True)
+    value = models.FloatField()
+    label = models.CharField(max_length=32, null=True)
+    is_valid = models.BooleanField()
+    parent = models.ForeignKey("self", null=True, on_delete=models.CASCADE)
+
+    class Meta:
+        app_label = "tests"
+        managed = False
+
+
+class MeasurementSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Measurement
+        fields = ["id", "count", "value", "label", "is_valid"]
+
+
+class FastMeasurementSerializer(FastSerializationMixin, MeasurementSerializer):
+    pass
+
+
+def measurements():
+    return [
+        Measurement(id=1, count=3, value=1.5, label="one", is_valid=True),
+        Measurement(id=2, count=None, value=2, label=None, is_valid=False),
+        Measurement(id=3, count="4", value="0.25", label=5, is_valid=1),
+    ]
+
+
+class TestFastSerializationMixin:
+    def test_matches_the_model_serializer(self):
+        instances = measurements()
+        expected = MeasurementSerializer(instances, many=True).data
+        serializer = FastMeasurementSerializer(instances, many=True)
+        assert serializer.child._fast_fields is not None
+        assert serializer.data == expected
+        assert serializer.data[1] == {
+            "id": 2,
+            "count": None,
+            "value": 2.0,
+            "label": None,
+            "is_valid": False,
+        }
+
+    def test_mappings_fall_back(self):
+        data = {"id": 1, "count": 3, "value": 1.5, "label": "one"}
+        serializer = FastMeasurementSerializer({**data, "is_valid": True})
+        assert serializer.data == {**data, "is_valid": True}
+
+        # NOTE: without save() the data is read from the validated_data
+        serializer = FastMeasurementSerializer(data={**data, "is_valid": 1})
+        assert serializer.is_valid(), serializer.errors
+        del data["id"]
+        assert serializer.data == {**data, "is_valid": True}
+
+    def test_method_fields_fall_back(self):
+        class Serializer(FastMeasurementSerializer):
+            double = serializers.SerializerMethodField()
+
+            class Meta(MeasurementSerializer.Meta):
+                fields = ["id", "double"]
+
+            def get_double(self, obj):
+                return obj.value * 2
+
+        serializer = Serializer(measurements()[0])
+        assert serializer._fast_fields is None
+        assert serializer.data == {"id": 1, "double": 3.0}
+
+    def test_dotted_sources_fall_back(self):
+        class Serializer(FastMeasurementSerializer):
+            parent_label = serializers.CharField(source="parent.label")
+
+            class Meta(MeasurementSerializer.Meta):
+                fields = ["id", "parent_label"]
+
+        parent, child, _ = measurements()
+        child.parent = parent
+        serializer = Serializer(child)
+        assert serializer._fast_fields is None
+        assert serializer.data == {"id": 2, "parent_label": "one"}
+
+    def test_field_subclasses_fall_back(self):
+        class Serializer(FastMeasurementSerializer):
+            label = AliasField()
+
+            class Meta(MeasurementSerializer.Meta):
+                fields = ["id", "label"]
+
+        serializer = Serializer(measurements()[0])
+        assert serializer._fast_fields is None
+        assert serializer.data == {"id": 1, "label": "one"}
+
+
+class CountingSerializer(MeasurementSerializer):
+    calls = 0
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        for field_name in set(self.fields) - set(fields or self.fields):
+            self.fields.pop(field_name)
+
+    def to_representation(self, instance):
+        CountingSerializer.calls += 1
+        return super().to_representation(instance)
+
+
+class CachedMeasurementSerializer(SerializerCacheMixin, CountingSerializer):
+    pass
+
+
+class ChildSerializer(serializers.ModelSerializer):
+    parent = CachedMeasurementSerializer()
+    parent_id = CachedMeasurementSerializer(source="parent", fields=["id"])
+
+    class Meta:
+        model = Measurement
+        fields = ["id", "parent", "parent_id"]
+
+
+class TestSerializerCacheMixin:
+    def setup_method(self):
+        CountingSerializer.calls = 0
+
+    def test_shared_instances_are_serialized_once(self):
+        parent, first, second = measurements()
+        first.parent = second.parent = parent
+        data = ChildSerializer([first, second], many=True).data
+        assert data[0]["parent"] == data[1]["parent"]
+        assert data[0]["parent"]["label"] == "one"
+        # NOTE: once per instance for each of the two configurations
+        assert CountingSerializer.calls == 2
+
+    def test_other_instances_are_serialized(self):
+        parent, first, second = measurements()
+        first.parent = parent
+        second.parent = Measurement(id=4, value=0, is_valid=True)
+        data = ChildSerializer([first, second], many=True).data
+        assert [row["parent"]["id"] for row in data] == [1, 4]
+        assert CountingSerializer.calls == 4
+
+    def test_fields_are_part_of_the_key(self):
+        parent, child, _ = measurements()
+        child.parent = parent
+        data = ChildSerializer(child).data
+        assert data["parent_id"] == {"id": 1}
+        assert data["parent"]["label"] == "one"
+
+    def test_cache_is_scoped_to_the_root_serializer(self):
+        instance = measurements()[0]
+        assert CachedMeasurementSerializer(instance).data["label"] == "one"
+        instance.label = "two"
+        assert CachedMeasurementSerializer(instance).data["label"] == "two"
+
+
+class TestAliasField:
+    def test_default_pattern(self):
+        field = AliasField()
+        assert _DEFAULT_ALIAS_VALIDATOR in field.validators
+        assert field.run_validation("user-name_1") == "user-name_1"
+        with pytest.raises(serializers.ValidationError) as exc_info:
+            field.run_validation("user name")
+        assert exc_info.value.get_codes() == ["invalid"]
+
+    def test_custom_pattern(self):
+        field = AliasField(alias_regex=r"^[a-z]*$")
+        assert _DEFAULT_ALIAS_VALIDATOR not in field.validators
+        assert field.run_validation("username") == "username"
+        with pytest.raises(serializers.ValidationError) as exc_info:
+            field.run_validation("user-name")
+        assert exc_info.value.get_codes() == ["invalid"]
+
+    def test_custom_message(self):
+        field = AliasField(error_messages={"invalid": "Not an alias."})
+        assert _DEFAULT_ALIAS_VALIDATOR not in field.validators
+        with pytest.raises(serializers.ValidationError) as exc_info:
+            field.run_validation("user name")
+        assert exc_info.value.detail == ["Not an alias."]
+        assert exc_info.value.get_codes() == ["invalid"]
@@ -0,0 +1,376 @@
+import pytest
+from django.contrib.auth.models import Group, Permission, User
+from django.contrib.contenttypes.fields import (
+    GenericForeignKey,
+    GenericRelation,
+)
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from rest_framework import serializers
+from rest_framework.filters import OrderingFilter, SearchFilter
+
+from drft.contrib.postgres.filters import (
+    RelevanceOrderingFilterBackend,
+    RelevanceSearchFilter,
+)
+from drft.filters import FilterBackend, OrderingFilterBackend
+from drft.responses import StreamingJSONResponse
+from drft.serializers import SerializerCacheMixin
+from drft.views import (
+    APIView,
+    _auto_prefetch,
+    _stream_rows,
+    action,
+    paged_response,
+)
+
+
+class SharedFilter(OrderingFilter):
+    shareable = True
+
+
+class UsersView(APIView):
+    filter_backends = [SharedFilter, SearchFilter]
+
+
+class TestFilterBackends:
+    def test_filter_backends_are_tuples(self):
+        assert UsersView.filter_backends == (SharedFilter, SearchFilter)
+        assert isinstance(APIView.filter_backends, tuple)
+
+    def test_shareable_instances_are_shared_between_requests(self):
+        filters = UsersView._get_queryset_filters(UsersView.filter_backends)
+        assert isinstance(filters[0].__self__, SharedFilter)
+        assert not hasattr(filters[1], "__self__")
+        assert (
+            UsersView._get_queryset_filters(UsersView.filter_backends)
+            is filters
+        )
+
+    def test_other_backends_are_instantiated_per_call(self, mocker):
+        view = UsersView()
+        view.request = mocker.Mock()
+        view.filter_backends = [SearchFilter]
+        search = mocker.patch.object(
+            SearchFilter, "filter_queryset", autospec=True
+        )
+        queryset = mocker.Mock()
+        assert view.filter_queryset(queryset) is search.return_value
+        view.filter_queryset(queryset)
+        first, second = (call[0][0] for call in search.call_args_list)
+        assert isinstance(first, SearchFilter)
+        assert first is not second
+
+    def test_stateless_drft_backends_are_shareable(self):
+        for backend in (
+            FilterBackend,
+            OrderingFilterBackend,
+            RelevanceOrderingFilterBackend,
+        ):
+            assert backend.__dict__["shareable"]
+        assert not getattr(RelevanceSearchFilter, "shareable", False)
+
+    def test_shareable_is_not_inherited(self):
+        class RequestFilter(FilterBackend):
+            pass
+
+        filters = UsersView._get_queryset_filters([RequestFilter])
+        assert not hasattr(filters[0], "__self__")
+
+    def test_instances_are_keyed_on_the_backends(self):
+        filters = UsersView._get_queryset_filters([SharedFilter])
+        assert len(filters) == 1
+        assert isinstance(filters[0].__self__, SharedFilter)
+        assert "_queryset_filters" not in APIView.__dict__
+
+
+class TestSerializerContext:
+    def test_context_is_built_once_per_request(self):
+        view = UsersView()
+        view.request = None
+        view.format_kwarg = "json"
+        context = view.get_serializer_context()
+        assert context == {
+            "request": None,
+            "format": "json",
+            "view": view,
+        }
+        assert view.get_serializer_context() is context
+
+    def test_overrides_can_update_the_context(self):
+        class PostsView(APIView):
+            def get_serializer_context(self):
+                context = super().get_serializer_context()
+                context["author"] = "someone"
+                return context
+
+        view = PostsView()
+        view.request = None
+        view.format_kwarg = None
+        assert view.get_serializer_context()["author"] == "someone"
+        assert view.get_serializer_context()["author"] == "someone"
+
+
+class TestPagedResponse:
+    def test_queryset_is_not_evaluated(self, mocker):
+        view = mocker.Mock()
+        queryset = mocker.MagicMock()
+        paged_response(view=view, queryset=queryset)
+        queryset.__bool__.assert_not_called()
+        view.get_queryset.assert_not_called()
+        view.filter_queryset.assert_called_once_with(queryset)
+
+    def test_defaults_to_the_view_queryset(self, mocker):
+        view = mocker.Mock()
+        view.paginate_queryset.return_value = None
+        result = paged_response(view=view)
+        view.filter_queryset.assert_called_once_with(
+            view.get_queryset.return_value
+        )
+        assert result.status_code == 200
+
+
+class TestPaginator:
+    def test_paginator_is_created_once(self, mocker):
+        view = UsersView()
+        view.pagination_class = mocker.Mock()
+        assert view.paginator is view.pagination_class.return_value
+        assert view.paginator is view.pagination_class.return_value
+        view.pagination_class.assert_called_once_with()
+
+    def test_paginator_is_none_without_a_pagination_class(self):
+        view = UsersView()
+        view.pagination_class = None
+        assert view.paginator is None
+        assert view.paginate_queryset([]) is None
+
+
+class TestAction:
+    def test_resets_the_view_configuration(self):
+        @action(["get"], detail=False, serializer_class=None)
+        def posts(self, request):
+            ...
+
+        assert posts.detail is False
+        for key in (
+            "ordering",
+            "ordering_fields",
+            "filterset_class",
+            "serializer_class",
+        ):
+            assert posts.kwargs[key] is None
+
+
+class PermissionSerializer(serializers.ModelSerializer):
+    content_type = serializers.StringRelatedField()
+
+    class Meta:
+        model = Permission
+        fields = ["id", "codename", "content_type"]
+
+
+class GroupSerializer(serializers.ModelSerializer):
+    permissions = PermissionSerializer(many=True)
+    user_count = serializers.IntegerField(source="user_set.count")
+
+    class Meta:
+        model = Group
+        fields = ["id", "name", "permissions", "user_count"]
+
+
+class UserSerializer(serializers.ModelSerializer):
+    groups = GroupSerializer(many=True)
+
+    class Meta:
+        model = User
+        fields = ["id", "username", "groups"]
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=32)
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    content_object = GenericForeignKey()
+
+    class Meta:
+        app_label = "tests"
+        managed = False
+
+
+class Bookmark(models.Model):
+    tags = GenericRelation(Tag)
+
+    class Meta:
+        app_label = "tests"
+        managed = False
+
+
+class BookmarkSerializer(serializers.ModelSerializer):
+    tags = serializers.SlugRelatedField(
+        slug_field="name", many=True, read_only=True
+    )
+
+    class Meta:
+        model = Bookmark
+        fields = ["id", "tags"]
+
+
+class TestAutoPrefetch:
+    def test_lookups_follow_the_serializer_fields(self):
+        queryset = _auto_prefetch(
+            Permission.objects.all(), PermissionSerializer()
+        )
+        assert queryset.query.select_related == {"content_type": {}}
+        assert queryset._prefetch_related_lookups == ()
+
+        queryset = _auto_prefetch(User.objects.all(), UserSerializer())
+        assert queryset.query.select_related is False
+        assert queryset._prefetch_related_lookups == (
+            "groups",
+            "groups__permissions",
+            "groups__permissions__content_type",
+            "groups__user_set",
+        )
+
+    def test_generic_relations_are_prefetched(self):
+        queryset = _auto_prefetch(Bookmark.objects.all(), BookmarkSerializer())
+        assert queryset.query.select_related is False
+        assert queryset._prefetch_related_lookups == ("tags",)
+
+    def test_paged_response_is_opt_in(self, mocker):
+        view = mocker.Mock(auto_prefetch=False)
+        queryset = User.objects.all()
+        paged_response(view=view, queryset=queryset)
+        view.filter_queryset.assert_called_once_with(queryset)
+
+        view = mocker.Mock(auto_prefetch=True)
+        view.get_serializer.return_value = UserSerializer()
+        paged_response(view=view, queryset=queryset)
+        prefetched = view.filter_queryset.call_args[0][0]
+        assert "groups" in prefetched._prefetch_related_lookups
+        view.get_serializer_class.assert_not_called()
+
+    def test_fields_are_read_from_the_view_serializer(self, mocker):
+        class RequestSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = Group
+                fields = ["id", "permissions"]
+
+            def get_fields(self):
+                fields = super().get_fields()
+                if self.context["request"] is None:
+                    del fields["permissions"]
+                return fields
+
+        view = UsersView()
+        view.request = None
+        view.format_kwarg = None
+        view.serializer_class = RequestSerializer
+        queryset = _auto_prefetch(Group.objects.all(), view.get_serializer())
+        assert queryset._prefetch_related_lookups == ()
+
+        view = UsersView()
+        view.request = mocker.Mock()
+        view.format_kwarg = None
+        view.serializer_class = RequestSerializer
+        queryset = _auto_prefetch(Group.objects.all(), view.get_serializer())
+        assert queryset._prefetch_related_lookups == ("permissions",)
+
+
+class TestGetQueryset:
+    def test_queryset_is_cloned_on_each_call(self):
+        view = UsersView()
+        view.queryset = User.objects.all()
+        queryset = view.get_queryset()
+        assert queryset is not view.queryset
+        assert view.get_queryset() is not queryset
+
+
+class TestGetSerializer:
+    def test_reads_the_serializer_class(self):
+        view = UsersView()
+        view.request = None
+        view.format_kwarg = None
+        view.serializer_class = UserSerializer
+        assert isinstance(view.get_serializer(), UserSerializer)
+
+        del view.serializer_class
+        with pytest.raises(AttributeError):
+            view.get_serializer()
+
+    def test_get_serializer_class_overrides_are_used(self):
+        class GroupsView(APIView):
+            serializer_class = UserSerializer
+
+            def get_serializer_class(self):
+                return GroupSerializer
+
+        view = GroupsView()
+        view.request = None
+        view.format_kwarg = None
+        assert isinstance(view.get_serializer(), GroupSerializer)
+
+
+class TestStreamingResponse:
+    def test_rows_are_streamed_as_a_json_array(self):
+        response = StreamingJSONResponse(iter([{"id": 1}, {"id": 2}]))
+        assert response["Content-Type"] == "application/json"
+        assert b"".join(response.streaming_content) == b'[{"id":1},{"id":2}]'
+        response = StreamingJSONResponse(iter([]))
+        assert b"".join(response.streaming_content) == b"[]"
+
+    @pytest.mark.django_db
+    def test_large_querysets_are_streamed(self, mocker):
+        User.objects.create(username="one")
+        User.objects.create(username="two")
+        view = mocker.Mock(auto_prefetch=False, streaming_threshold=1)
+        view.filter_queryset.side_effect = lambda queryset: queryset
+        view.paginate_queryset.return_value = None
+        view.get_serializer.return_value.to_representation = (
+            lambda user: user.username
+        )
+        result = paged_response(view=view, queryset=User.objects.all())
+        assert isinstance(result, StreamingJSONResponse)
+        assert b"".join(result.streaming_content) == b'["one","two"]'
+
+        view.streaming_threshold = 2
+        result = paged_response(view=view, queryset=User.objects.all())
+        assert not isinstance(result, StreamingJSONResponse)
+
+    @pytest.mark.django_db
+    def test_prefetched_querysets_are_streamed_in_chunks(
+        self, django_assert_num_queries
+    ):
+        group = Group.objects.create(name="staff")
+        for username in ("one", "two", "three"):
+            User.objects.create(username=username).groups.add(group)
+
+        class CachedGroupSerializer(
+            SerializerCacheMixin, serializers.ModelSerializer
+        ):
+            class Meta:
+                model = Group
+                fields = ["name"]
+
+        class Serializer(serializers.ModelSerializer):
+            groups = CachedGroupSerializer(many=True)
+
+            class Meta:
+                model = User
+                fields = ["username", "groups"]
+
+        serializer = Serializer()
+        queryset = User.objects.order_by("id").prefetch_related("groups")
+        rows = _stream_rows(serializer, queryset, chunk_size=2)
+        with django_assert_num_queries(2):
+            assert next(rows) == {
+                "username": "one",
+                "groups": [{"name": "staff"}],
+            }
+            assert "_repr_cache" in serializer.__dict__
+            next(rows)
+        with django_assert_num_queries(1):
+            assert next(rows)["username"] == "three"
+            assert len(serializer.__dict__["_repr_cache"]) == 1
+        assert list(rows) == []
+        assert "_repr_cache" not in serializer.__dict__